@@ -15,6 +15,18 @@ import math
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
+try:
+    import orjson
+
+    # numpy scalars stay numbers (json.dump wrote them as numbers too), not default=str strings
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS, default=str)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
 # ============================================================================
 # SETUP
 # ============================================================================
@@ -226,6 +238,11 @@ class DataProcessor:
 # ============================================================================
 
 class GoogleSheetsExporter:
+    # Shared by every export in the process (credentials parsed once)
+    _client = None
+    _spreadsheet = None
+    _worksheets: Dict[str, Any] = {}
+    
     def __init__(self):
         # Priority logic for Spreadsheet ID
         env_id = os.environ.get('SPREADSHEET_ID')
@@ -239,56 +256,72 @@ class GoogleSheetsExporter:
         self.sheet_name = 'Finance Bladi'
         self.headers = DataProcessor.COLUMNS
     
+    def _load_credentials(self):
+        from google.oauth2.service_account import Credentials
+        
+        scopes = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
+
+        # --- 1. Load from Secret (GOOGLE_CREDENTIALS) ---
+        # This matches your existing secret name
+        secret_creds = os.environ.get('GOOGLE_CREDENTIALS')
+        
+        if secret_creds:
+            try:
+                print("🔑 Loading credentials from 'GOOGLE_CREDENTIALS' environment variable...")
+                creds_dict = json.loads(secret_creds)
+                return Credentials.from_service_account_info(creds_dict, scopes=scopes)
+            except json.JSONDecodeError:
+                print("❌ Error: 'GOOGLE_CREDENTIALS' is not valid JSON. Please check your GitHub Secret content.")
+                return None
+        
+        # --- 2. Fallback: Local File (for local testing only) ---
+        print("⚠️ Secret not found. Checking local files...")
+        possible_paths = [
+            'credentials.json',
+            os.path.join(PROJECT_ROOT, 'credentials.json'),
+            os.path.join(os.getcwd(), 'credentials.json')
+        ]
+        for p in possible_paths:
+            if os.path.exists(p):
+                print(f"✅ Found local file: {p}")
+                return Credentials.from_service_account_file(p, scopes=scopes)
+        
+        print("❌ Authentication failed: No valid credentials found in GOOGLE_CREDENTIALS secret or local file.")
+        return None
+
+    def _get_spreadsheet(self):
+        """Authenticated client and opened spreadsheet, created once per process"""
+        import gspread
+        cls = GoogleSheetsExporter
+        
+        if cls._client is None:
+            credentials = self._load_credentials()
+            if not credentials:
+                return None
+            cls._client = gspread.authorize(credentials)
+        
+        if cls._spreadsheet is None or cls._spreadsheet.id != self.spreadsheet_id:
+            print(f"📄 Opening spreadsheet: {self.spreadsheet_id}")
+            cls._spreadsheet = cls._client.open_by_key(self.spreadsheet_id)
+            cls._worksheets = {ws.title: ws for ws in cls._spreadsheet.worksheets()}
+        
+        return cls._spreadsheet
+
     def export(self, data_row: List[List[Any]]) -> bool:
         try:
             print("\n📤 Connecting to Google Sheets...")
-            import gspread
-            from google.oauth2.service_account import Credentials
-            
-            scopes = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
-            credentials = None
-
-            # --- 1. Load from Secret (GOOGLE_CREDENTIALS) ---
-            # This matches your existing secret name
-            secret_creds = os.environ.get('GOOGLE_CREDENTIALS')
-            
-            if secret_creds:
-                try:
-                    print("🔑 Loading credentials from 'GOOGLE_CREDENTIALS' environment variable...")
-                    creds_dict = json.loads(secret_creds)
-                    credentials = Credentials.from_service_account_info(creds_dict, scopes=scopes)
-                except json.JSONDecodeError:
-                    print("❌ Error: 'GOOGLE_CREDENTIALS' is not valid JSON. Please check your GitHub Secret content.")
-                    return False
+            from gspread.utils import rowcol_to_a1
             
-            # --- 2. Fallback: Local File (for local testing only) ---
-            if not credentials:
-                print("⚠️ Secret not found. Checking local files...")
-                possible_paths = [
-                    'credentials.json',
-                    os.path.join(PROJECT_ROOT, 'credentials.json'),
-                    os.path.join(os.getcwd(), 'credentials.json')
-                ]
-                for p in possible_paths:
-                    if os.path.exists(p):
-                        print(f"✅ Found local file: {p}")
-                        credentials = Credentials.from_service_account_file(p, scopes=scopes)
-                        break
-            
-            if not credentials:
-                print("❌ Authentication failed: No valid credentials found in GOOGLE_CREDENTIALS secret or local file.")
+            spreadsheet = self._get_spreadsheet()
+            if spreadsheet is None:
                 return False
 
             # --- 3. Update Sheet ---
-            client = gspread.authorize(credentials)
-            print(f"📄 Opening spreadsheet: {self.spreadsheet_id}")
-            spreadsheet = client.open_by_key(self.spreadsheet_id)
-            
-            try:
-                worksheet = spreadsheet.worksheet(self.sheet_name)
-            except:
+            worksheet = self._worksheets.get(self.sheet_name)
+            if worksheet is None:
                 print(f"📝 Creating new sheet: '{self.sheet_name}'")
                 worksheet = spreadsheet.add_worksheet(title=self.sheet_name, rows=1000, cols=len(self.headers))
+                self._worksheets[self.sheet_name] = worksheet
             
             self._ensure_headers(worksheet)
             
@@ -307,12 +340,14 @@ class GoogleSheetsExporter:
             
             if row_index:
                 print(f"📝 Updating existing row {row_index} for {today_date}...")
-                # Update specific range to save API calls
-                cell_list = worksheet.range(f"A{row_index}:V{row_index}") # Adjust 'V' to your last column letter
-                for i, cell in enumerate(cell_list):
-                    if i < len(clean_row):
-                        cell.value = clean_row[i]
-                worksheet.update_cells(cell_list)
+                # Single batched write of the whole row (no read of the range first);
+                # RAW like append_row below, so both branches store the same cell types
+                end_cell = rowcol_to_a1(row_index, len(clean_row))
+                worksheet.update(
+                    range_name=f"A{row_index}:{end_cell}",
+                    values=[clean_row],
+                    value_input_option='RAW'
+                )
                 print(f"✅ Updated row {row_index}")
             else:
                 print(f"📝 Adding new row for {today_date}...")
@@ -346,8 +381,8 @@ class LocalStorage:
     
     def save(self, raw_data: Dict, processed_row: List[List[Any]]):
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        with open(os.path.join(self.data_dir, f'raw_{timestamp}.json'), 'w') as f:
-            json.dump(raw_data, f, indent=2, default=str)
+        with open(os.path.join(self.data_dir, f'raw_{timestamp}.json'), 'wb') as f:
+            f.write(_dumps(raw_data))
         
         with open(os.path.join(self.data_dir, f'data_{timestamp}.csv'), 'w') as f:
             f.write(','.join(DataProcessor.COLUMNS) + '\n')
@@ -1,5 +1,5 @@
 import pandas as pd
-from io import StringIO
+from io import BytesIO
 import logging
 import sys
 import os
@@ -17,6 +17,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# French decimal comma -> dot, drop non-breaking spaces
+_RATE_CLEAN_TABLE = str.maketrans({',': '.', '\xa0': ''})
+
 def get_bkam_forex_rates():
     """
     Fetches official EUR/MAD and USD/MAD rates.
@@ -28,8 +31,8 @@ def get_bkam_forex_rates():
     if not response: return None
 
     try:
-        # 1. Parse HTML (Force string to avoid comma/thousands confusion)
-        dfs = pd.read_html(StringIO(response.text), thousands=None, decimal=',')
+        # 1. Parse HTML from raw bytes with the HTTP charset (thousands=None avoids comma/thousands confusion)
+        dfs = pd.read_html(BytesIO(response.content), encoding=response.encoding, thousands=None, decimal=',')
         if not dfs: return None
         df = dfs[0].astype(str)
         
@@ -42,7 +45,7 @@ def get_bkam_forex_rates():
             try:
                 # 2. Clean Data
                 raw_val = row.iloc[rate_col_idx]
-                clean_val_str = raw_val.replace(',', '.').replace('\xa0', '').strip()
+                clean_val_str = raw_val.translate(_RATE_CLEAN_TABLE).strip()
                 val = float(clean_val_str)
                 
                 # 3. Sanity Check (Fix 107602 -> 10.7602)
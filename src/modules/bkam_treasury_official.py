@@ -1,6 +1,6 @@
 import pandas as pd
 from datetime import datetime
-from io import StringIO
+from io import BytesIO
 import logging
 import sys
 import os
@@ -8,19 +8,33 @@ import os
 # Import scraper utility
 try:
     from src.utils.scraper_utils import fetch_url
+    from src.utils.cache import cached
 except ImportError:
     sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
     from src.utils.scraper_utils import fetch_url
+    from src.utils.cache import cached
 
 logger = logging.getLogger(__name__)
 
-def interpolate_linear(target_years, sorted_data):
+# French number format "2,210 %" -> "2.210" in a single pass per cell
+_RATE_CLEAN_TABLE = str.maketrans({',': '.', '%': '', ' ': '', '\xa0': ''})
+
+# Standard maturities: (result key, years, days) with days = int(years * 365)
+_STANDARD = (
+    ('bt2y', 2.0, 730),
+    ('bt5y', 5.0, 1825),
+    ('bt10y', 10.0, 3650),
+)
+
+def interpolate_linear(target_years, sorted_data, target_days=None):
     """
     Standard Linear Interpolation: Y = Y1 + (x - x1) * (Y2 - Y1) / (X2 - X1)
+    target_days can be passed precomputed; otherwise it is derived from target_years.
     """
     if not sorted_data: return None
     
-    target_days = int(target_years * 365)
+    if target_days is None:
+        target_days = int(target_years * 365)
     
     # 1. Boundary Checks
     if target_days <= sorted_data[0]['days']: return sorted_data[0]['rate']
@@ -44,13 +58,23 @@ def interpolate_linear(target_years, sorted_data):
     fraction = (target_days - p1['days']) / days_diff
     interpolated_rate = p1['rate'] + (fraction * rate_diff)
     
-    # Log the calculation for transparency
-    print(f"\n[CALCUL] BT{target_years}Y ({target_years} ans):")
-    print(f"  → Interpolé: {interpolated_rate:.3f}%")
-    print(f"  → Bornes: {p1['date'].strftime('%d/%m/%Y')} ({p1['rate']}%) <---> {p2['date'].strftime('%d/%m/%Y')} ({p2['rate']}%)")
+    # Log the calculation for transparency (formatted only when DEBUG is enabled)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "[CALCUL] BT%sY (%s ans): Interpolé %.3f%% | Bornes: %s (%s%%) <---> %s (%s%%)",
+            target_years, target_years, interpolated_rate,
+            p1['date'].strftime('%d/%m/%Y'), p1['rate'],
+            p2['date'].strftime('%d/%m/%Y'), p2['rate']
+        )
     
     return round(interpolated_rate, 3)
 
+# BKAM publishes the reference rates once per business day: cache per calendar
+# date (days-to-maturity change daily too), the TTL only bounds the entry's age
+@cached(
+    'bkam_treasury', ttl_seconds=86400, cache_if=lambda r: any(r.values()),
+    key_scope=lambda: datetime.now().date().isoformat()
+)
 def get_bkam_treasury_official():
     url = "https://www.bkam.ma/Marches/Principaux-indicateurs/Marche-obligataire/Marche-des-bons-de-tresor/Marche-secondaire/Taux-de-reference-des-bons-du-tresor"
     results = {'bt2y': '', 'bt5y': '', 'bt10y': ''}
@@ -61,8 +85,9 @@ def get_bkam_treasury_official():
         return results
 
     try:
-        # Read ALL tables on the page
-        dfs = pd.read_html(StringIO(response.text))
+        # Read ALL tables on the page (raw bytes, decoded with the HTTP charset:
+        # without it lxml guesses when the page has no <meta charset>)
+        dfs = pd.read_html(BytesIO(response.content), encoding=response.encoding)
         
         if not dfs:
             logger.error("❌ No tables found in HTML")
@@ -97,29 +122,28 @@ def get_bkam_treasury_official():
             logger.error("❌ Could not identify the Treasury table. Website structure might have changed.")
             return results
 
+        # --- CLEAN COLUMNS ONCE (vectorized) ---
+        # Rates: handle French format "2,210 %"; dates: dd/mm/yyyy, but each cell is
+        # parsed on its own (format='mixed') so rows in another layout aren't dropped
+        target_df[rate_col] = pd.to_numeric(
+            target_df[rate_col].astype(str).str.translate(_RATE_CLEAN_TABLE),
+            errors='coerce'
+        )
+        target_df[date_col] = pd.to_datetime(
+            target_df[date_col].astype(str), format='mixed', dayfirst=True, errors='coerce'
+        )
+
         # --- DATA EXTRACTION ---
         today = datetime.now()
-        data_points = []
-
-        for index, row in target_df.iterrows():
-            try:
-                # 1. Parse Date
-                date_val = str(row[date_col])
-                maturity = pd.to_datetime(date_val, dayfirst=True, errors='coerce')
-                
-                if pd.isna(maturity): continue
-                
-                # 2. Parse Rate (Handle French format "2,210 %")
-                raw_rate = str(row[rate_col]).replace(',', '.').replace('%', '').strip()
-                rate = float(raw_rate)
-                
-                # 3. Calculate Days
-                days = (maturity - today).days
-                if days <= 0: continue # Skip expired
-
-                data_points.append({'days': days, 'rate': rate, 'date': maturity})
-            except Exception:
-                continue
+        valid = target_df[[date_col, rate_col]].dropna()
+        days = (valid[date_col] - today).dt.days
+        valid = valid[days > 0]  # Skip expired
+        days = days[days > 0]
+
+        data_points = [
+            {'days': d, 'rate': r, 'date': m}
+            for d, r, m in zip(days.tolist(), valid[rate_col].tolist(), valid[date_col].tolist())
+        ]
         
         # Sort by duration for interpolation
         data_points.sort(key=lambda x: x['days'])
@@ -128,14 +152,16 @@ def get_bkam_treasury_official():
             logger.warning("⚠️ Table found but no valid rows extracted.")
             return results
 
-        print("="*50)
-        print(f"📊 {len(data_points)} Lignes extraites. Lancement de l'interpolation...")
-        print("="*50)
+        banner = "=" * 50
+        sys.stdout.write("\n".join([
+            banner,
+            f"📊 {len(data_points)} Lignes extraites. Lancement de l'interpolation...",
+            banner
+        ]) + "\n")
 
         # --- INTERPOLATION ---
-        results['bt2y'] = interpolate_linear(2.0, data_points)
-        results['bt5y'] = interpolate_linear(5.0, data_points)
-        results['bt10y'] = interpolate_linear(10.0, data_points)
+        for key, years, days in _STANDARD:
+            results[key] = interpolate_linear(years, data_points, days)
         
         return results
 
@@ -1,12 +1,23 @@
 # modules/investing_masi.py - Updated version
-import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import pandas as pd
 import logging
+import sys
+import os
 from datetime import datetime
 
+# Shared HTTP/2 client (connections multiplexed across Investing.com requests) and on-disk result cache
+try:
+    from src.utils.http_session import get_http_client
+    from src.utils.cache import cached
+except ImportError:
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+    from src.utils.http_session import get_http_client
+    from src.utils.cache import cached
+
 logger = logging.getLogger(__name__)
 
+@cached('investing_masi', ttl_seconds=300, cache_if=lambda r: 'error' not in r)
 def collect_data(config=None):
     """Collect MASI index data from Investing.com"""
     try:
@@ -15,20 +26,16 @@ def collect_data(config=None):
         # Updated URL for Moroccan stock market
         url = "https://www.investing.com/indices/masi"
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
+        response = get_http_client().get(url)
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = LexborHTMLParser(response.content)
             
             # Try to find MASI price (Investing.com structure may vary)
-            price_element = soup.find('div', {'data-test': 'instrument-price-last'})
+            price_element = tree.css_first('div[data-test="instrument-price-last"]')
             
             if price_element:
-                price = price_element.text.strip()
+                price = price_element.text().strip()
                 print(f"  ✓ MASI: {price}")
                 
                 # Create result
@@ -42,9 +49,10 @@ def collect_data(config=None):
                 return result
             else:
                 # Alternative search for price
-                for element in soup.find_all('span', class_='text-2xl'):
-                    if 'MAD' in element.text or any(char.isdigit() for char in element.text):
-                        price = element.text.strip()
+                for element in tree.css('span.text-2xl'):
+                    text = element.text()
+                    if 'MAD' in text or any(char.isdigit() for char in text):
+                        price = text.strip()
                         print(f"  ✓ MASI: {price}")
                         return {
                             'MASI': price,
@@ -1,8 +1,26 @@
 # src/modules/trading_economics.py
-import requests
 from datetime import datetime as dt
 import re
+import sys
+import os
 
+# Shared HTTP session (keep-alive across collectors) and on-disk result cache
+try:
+    from src.utils.http_session import get_session, DEFAULT_TIMEOUT
+    from src.utils.cache import cached
+except ImportError:
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+    from src.utils.http_session import get_session, DEFAULT_TIMEOUT
+    from src.utils.cache import cached
+
+# Prix embarqué dans le JSON de la page: "price":"625.00"
+_PRICE_JSON_RE = re.compile(rb'"price"\s*:\s*"([\d.]+)"')
+# Tableau: <td>625.00</td><td>...</td> (valeur 'Actual')
+_PRICE_TD_RE = re.compile(rb'<td>(\d+\.?\d*)</td>\s*<td>(\d+\.?\d*)</td>')
+# Taille de la fenêtre scannée après l'en-tête 'Actual'
+_ACTUAL_WINDOW = 2000
+
+@cached('trading_economics', ttl_seconds=3600, cache_if=lambda r: r.get('PHOSPHATE_DAP') is not None)
 def get_phosphate_price():
     """
     Récupère le prix du Phosphate DAP depuis TradingEconomics.
@@ -12,36 +30,33 @@ def get_phosphate_price():
     try:
         url = "https://tradingeconomics.com/commodity/di-ammonium"
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=30)
+        response = get_session().get(url, timeout=DEFAULT_TIMEOUT)
         
         if response.status_code != 200:
             raise Exception(f"HTTP {response.status_code}")
         
-        html_content = response.text
+        # Scan the raw bytes: no full-page decode
+        html_content = response.content
         
-        # Chercher la valeur dans le tableau (selon votre structure HTML)
-        # Pattern pour: <td>625.00</td> (valeur 'Actual')
-        pattern = r'<td>(\d+\.?\d*)</td>\s*<td>(\d+\.?\d*)</td>'
+        # 1. Valeur JSON embarquée: une seule recherche, arrêt au premier match
+        match = _PRICE_JSON_RE.search(html_content)
+        if match:
+            phosphate_value = float(match.group(1).decode('ascii'))
+            print(f"  ✓ Phosphate DAP: {phosphate_value} USD/T")
+            return {'PHOSPHATE_DAP': phosphate_value, 'PHOSPHATE_SOURCE': 'TradingEconomics'}
         
-        matches = re.findall(pattern, html_content)
+        # 2. Tableau: ne scanner que la zone qui suit 'Actual' (toute la page si absent)
+        idx = html_content.find(b'Actual')
+        if idx == -1:
+            match = _PRICE_TD_RE.search(html_content)
+        else:
+            match = _PRICE_TD_RE.search(html_content, idx, idx + _ACTUAL_WINDOW)
         
-        if matches and len(matches) > 0:
+        if match:
             # Prendre la première valeur (Actual)
-            phosphate_value = float(matches[0][0])
-            print(f"  ✓ Phosphate DAP: {phosphate_value} USD/T")
+            phosphate_value = float(match.group(1).decode('ascii'))
+            print(f"  ✓ Phosphate DAP (tableau): {phosphate_value} USD/T")
             return {'PHOSPHATE_DAP': phosphate_value, 'PHOSPHATE_SOURCE': 'TradingEconomics'}
-        else:
-            # Autre pattern
-            pattern2 = r'"price":"([\d\.]+)"'
-            match = re.search(pattern2, html_content)
-            if match:
-                phosphate_value = float(match.group(1))
-                print(f"  ✓ Phosphate DAP (pattern2): {phosphate_value} USD/T")
-                return {'PHOSPHATE_DAP': phosphate_value, 'PHOSPHATE_SOURCE': 'TradingEconomics'}
         
         print("  ⚠️  Phosphate non trouvé")
         return {'PHOSPHATE_DAP': None}
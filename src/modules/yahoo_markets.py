@@ -1,15 +1,42 @@
 # src/modules/yahoo_markets.py - IMPROVED WITH INVESTING.COM FALLBACK
+import asyncio
+import httpx
 import yfinance as yf
 import pandas as pd
 from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
+from requests.exceptions import RequestException
+from selectolax.lexbor import LexborHTMLParser
 import logging
-import time
-import json
+import sys
+import os
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Shared HTTP session (keep-alive across collectors) and on-disk result cache
+try:
+    from src.utils.http_session import get_session, get_http_client, CircuitOpen, DEFAULT_TIMEOUT, DEFAULT_HEADERS
+    from src.utils.cache import cached
+except ImportError:
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+    from src.utils.http_session import get_session, get_http_client, CircuitOpen, DEFAULT_TIMEOUT, DEFAULT_HEADERS
+    from src.utils.cache import cached
 
 logger = logging.getLogger(__name__)
 
+# Concurrent asset fetches in collect_data
+MAX_WORKERS = 8
+
+# Chart API: last price in meta.regularMarketPrice, no DataFrame needed
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
+
+# Thousands separators and currency symbols stripped from scraped prices
+_PRICE_CLEAN_TABLE = str.maketrans('', '', ',$€£')
+
 def get_from_investing(symbol: str) -> float:
     """Get data from Investing.com as fallback"""
     investing_map = {
@@ -37,22 +64,18 @@ def get_from_investing(symbol: str) -> float:
     try:
         url = f"https://www.investing.com/indices/{investing_map[symbol]}"
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
+        response = get_http_client().get(url)
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = LexborHTMLParser(response.content)
             
             # Try to find price (Investing.com structure)
-            price_element = soup.find('div', {'data-test': 'instrument-price-last'})
+            price_element = tree.css_first('div[data-test="instrument-price-last"]')
             
             if price_element:
-                price_text = price_element.text.strip()
+                price_text = price_element.text().strip()
                 # Clean the price (remove commas, symbols)
-                price_text = price_text.replace(',', '').replace('$', '').replace('€', '').replace('£', '')
+                price_text = price_text.translate(_PRICE_CLEAN_TABLE)
                 
                 try:
                     return float(price_text)
@@ -61,34 +84,76 @@ def get_from_investing(symbol: str) -> float:
         
         return None
         
+    except CircuitOpen as e:
+        # Host recently failing: skip without waiting on the network
+        logger.debug(f"Investing.com skipped for {symbol}: {e}")
+        return None
     except Exception as e:
         logger.warning(f"Investing.com fallback failed for {symbol}: {e}")
         return None
 
-def get_from_yahoo(symbol: str, ticker: str, retries: int = 2) -> float:
-    """Get data from Yahoo Finance with retries"""
-    for attempt in range(retries):
+def get_yahoo_price(session, ticker: str) -> float:
+    """Get the last price for one ticker straight from Yahoo's chart JSON"""
+    response = session.get(
+        YAHOO_CHART_URL.format(ticker=quote(ticker, safe='')),
+        params={'range': '1d', 'interval': '1d'},
+        timeout=DEFAULT_TIMEOUT
+    )
+    response.raise_for_status()
+    return float(json_loads(response.content)['chart']['result'][0]['meta']['regularMarketPrice'])
+
+def get_from_yahoo(symbol: str, ticker: str) -> float:
+    """Get data from Yahoo Finance for a single ticker (chart JSON, then yfinance)"""
+    try:
+        return get_yahoo_price(get_session(), ticker)
+    except (KeyError, IndexError, TypeError, ValueError, RequestException) as e:
+        logger.debug(f"Yahoo chart API failed for {symbol}, falling back to yfinance: {e}")
+    
+    try:
+        stock = yf.Ticker(ticker)
+        hist = stock.history(period="1d")
+        
+        if not hist.empty:
+            return float(hist['Close'].iloc[-1])
+        
+        # Try 1-minute data if daily fails
+        hist = stock.history(period="1d", interval="1m")
+        if not hist.empty:
+            return float(hist['Close'].iloc[-1])
+        
+        return None
+        
+    except Exception as e:
+        logger.warning(f"Yahoo Finance failed for {symbol}: {e}")
+        return None
+
+def get_batch_from_yahoo(tickers: list) -> dict:
+    """Get the last close for many tickers with a single yfinance download"""
+    closes = {}
+    try:
+        df = yf.download(
+            " ".join(tickers), period="1d", interval="1d",
+            group_by='ticker', threads=True, progress=False
+        )
+    except Exception as e:
+        logger.warning(f"Yahoo Finance batch download failed: {e}")
+        return closes
+    
+    for ticker in tickers:
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period="1d")
-            
-            if not hist.empty:
-                return float(hist['Close'].iloc[-1])
-            
-            # Try 1-minute data if daily fails
-            hist = stock.history(period="1d", interval="1m")
-            if not hist.empty:
-                return float(hist['Close'].iloc[-1])
-            
-            return None
-            
-        except Exception as e:
-            if attempt < retries - 1:
-                time.sleep(1)  # Wait before retry
-                continue
-            logger.warning(f"Yahoo Finance failed for {symbol}: {e}")
-            return None
+            close = df[ticker]['Close'].dropna()
+        except KeyError:
+            continue
+        if not close.empty:
+            closes[ticker] = float(close.iloc[-1])
+    
+    return closes
+
+def _has_any_price(results: dict) -> bool:
+    """Cache predicate: at least one asset price was retrieved (metadata keys excluded)"""
+    return any(value is not None for key, value in results.items() if not key.startswith('YAHOO_'))
 
+@cached('yahoo_markets', ttl_seconds=120, cache_if=_has_any_price)
 def collect_data():
     """Collect market data with Yahoo Finance primary and Investing.com fallback"""
     print("\nCollecte Yahoo Finance avec fallback Investing.com...")
@@ -126,28 +191,42 @@ def collect_data():
     successful = 0
     total = len(assets)
     
-    for symbol, (ticker, description) in assets.items():
-        print(f"  → {symbol}: ", end='')
-        
-        # Try Yahoo first
+    # Yahoo first: one batched request for every ticker
+    batch = get_batch_from_yahoo([ticker for ticker, _ in assets.values()])
+    
+    # Keep the asset order in results regardless of completion order
+    missing = {}
+    for symbol, (ticker, _) in assets.items():
+        value = batch.get(ticker)
+        results[symbol] = value
+        if value is None:
+            missing[symbol] = ticker
+        else:
+            successful += 1
+            print(f"  → {symbol}: ✓ {value}")
+    
+    def fetch(symbol, ticker):
+        # Retry Yahoo once for this ticker only
         value = get_from_yahoo(symbol, ticker)
+        if value is not None and not (isinstance(value, float) and pd.isna(value)):
+            return symbol, value, 'Yahoo'
         
         # If Yahoo returns None or nan, try Investing.com
-        if value is None or (isinstance(value, float) and pd.isna(value)):
-            print(f"Yahoo failed, trying Investing.com...", end='')
-            value = get_from_investing(symbol)
+        return symbol, get_from_investing(symbol), 'Investing'
+    
+    # Network-bound: overlap the per-asset requests for the missing subset
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(fetch, symbol, ticker) for symbol, ticker in missing.items()]
+        
+        for future in as_completed(futures):
+            symbol, value, source = future.result()
             
             if value is not None:
                 results[symbol] = value
                 successful += 1
-                print(f"✓ {value} (Investing)")
+                print(f"  → {symbol}: ✓ {value}" + (" (Investing)" if source == 'Investing' else ""))
             else:
-                results[symbol] = None
-                print(f"✗ Both failed")
-        else:
-            results[symbol] = value
-            successful += 1
-            print(f"✓ {value}")
+                print(f"  → {symbol}: ✗ Both failed")
     
     print(f"  → {successful}/{total} actifs récupérés")
     
@@ -158,39 +237,55 @@ def collect_data():
     
     return results
 
+async def _fetch_json(client, url: str):
+    """GET url and decode its JSON body, None on any failure"""
+    try:
+        response = await client.get(url)
+        response.raise_for_status()
+        return json_loads(response.content)
+    except Exception as e:
+        logger.debug(f"Alternative source failed ({url}): {e}")
+        return None
+
+async def _fetch_all_json(urls: list) -> list:
+    """Fetch independent JSON APIs concurrently on one event loop"""
+    async with httpx.AsyncClient(timeout=5, http2=True, headers=DEFAULT_HEADERS) as client:
+        return await asyncio.gather(*(_fetch_json(client, url) for url in urls))
+
 def get_alternative_data(existing_results: dict) -> dict:
     """Try alternative APIs for critical assets"""
     try:
         # Try Alpha Vantage for stock indices (free tier)
         alpha_vantage_key = 'demo'  # Replace with your API key if available
         
-        # S&P 500 from Alpha Vantage
+        urls = [
+            # S&P 500 from Alpha Vantage
+            f"https://www.alphavantage.co/query?function=GLOBAL_QUOTE&symbol=SPY&apikey={alpha_vantage_key}",
+            # Try cryptocurrency APIs for Bitcoin
+            "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd",
+            # Try forex API for currency pairs
+            "https://api.exchangerate-api.com/v4/latest/USD"
+        ]
+        alpha, coingecko, forex = asyncio.run(_fetch_all_json(urls))
+        
         try:
-            url = f"https://www.alphavantage.co/query?function=GLOBAL_QUOTE&symbol=SPY&apikey={alpha_vantage_key}"
-            response = requests.get(url, timeout=5).json()
-            if 'Global Quote' in response:
-                sp500_price = float(response['Global Quote']['05. price'])
+            if alpha and 'Global Quote' in alpha:
+                sp500_price = float(alpha['Global Quote']['05. price'])
                 existing_results['SP500'] = sp500_price
-        except:
+        except (KeyError, TypeError, ValueError):
             pass
         
-        # Try cryptocurrency APIs for Bitcoin
         try:
-            url = "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd"
-            response = requests.get(url, timeout=5).json()
-            if 'bitcoin' in response:
-                existing_results['BITCOIN'] = response['bitcoin']['usd']
-        except:
+            if coingecko and 'bitcoin' in coingecko:
+                existing_results['BITCOIN'] = coingecko['bitcoin']['usd']
+        except (KeyError, TypeError):
             pass
         
-        # Try forex API for currency pairs
         try:
-            url = "https://api.exchangerate-api.com/v4/latest/USD"
-            response = requests.get(url, timeout=5).json()
-            if 'rates' in response:
-                existing_results['EURUSD'] = 1 / response['rates']['EUR'] if 'EUR' in response['rates'] else None
-                existing_results['USDJPY'] = response['rates']['JPY'] if 'JPY' in response['rates'] else None
-        except:
+            if forex and 'rates' in forex:
+                existing_results['EURUSD'] = 1 / forex['rates']['EUR'] if 'EUR' in forex['rates'] else None
+                existing_results['USDJPY'] = forex['rates']['JPY'] if 'JPY' in forex['rates'] else None
+        except (KeyError, TypeError, ZeroDivisionError):
             pass
         
     except Exception as e:
@@ -0,0 +1,113 @@
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+CACHE_DIR = os.path.join(PROJECT_ROOT, '.cache')
+
+_MISS = object()
+
+def make_key(*parts):
+    """Stable cache key (md5 hex digest) for any repr-able arguments."""
+    return hashlib.md5(repr(parts).encode('utf-8')).hexdigest()
+
+class FileCache:
+    """
+    JSON file cache with per-entry timestamps.
+
+    Entries are stored as {"ts": <epoch seconds>, "value": ...} in
+    .cache/{namespace}/{key}.json; an entry is served while it is younger
+    than the TTL given at lookup time.
+    """
+
+    def __init__(self, namespace, cache_dir=CACHE_DIR):
+        self.directory = os.path.join(cache_dir, namespace)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key, ttl_seconds, default=None):
+        """Return the cached value for key if fresh, otherwise default."""
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return default
+
+        if time.time() - entry.get('ts', 0) < ttl_seconds:
+            return entry.get('value', default)
+        return default
+
+    def set(self, key, value):
+        """Store value under key (atomic replace, safe across threads and processes)."""
+        tmp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Unique temp file per writer, so concurrent sets of one key never share it
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f"{key}.", suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'ts': time.time(), 'value': value}, f, default=str)
+            os.replace(tmp_path, self._path(key))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ Could not write cache entry {key}: {e}")
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def get_or_set(self, key, ttl_seconds, producer, cache_if=None):
+        """
+        Return the fresh cached value for key, or call producer() and cache its result.
+
+        Args:
+            key (str): Cache key.
+            ttl_seconds (float): Maximum age of a usable entry.
+            producer (callable): Computes the value on a cache miss.
+            cache_if (callable): Predicate deciding whether a produced value is
+                worth caching (default: anything but None).
+
+        Returns:
+            The cached or freshly produced value.
+        """
+        value = self.get(key, ttl_seconds, default=_MISS)
+        if value is not _MISS:
+            logger.info(f"💾 Cache hit: {self.directory} [{key[:8]}]")
+            return value
+
+        value = producer()
+        should_cache = cache_if(value) if cache_if else value is not None
+        if should_cache:
+            self.set(key, value)
+        return value
+
+def cached(namespace, ttl_seconds, cache_if=None, key_scope=None):
+    """
+    Decorator caching a function's result on disk for ttl_seconds.
+
+    The key is derived from the function name and its arguments; results
+    rejected by cache_if (e.g. failure payloads) are never stored. key_scope,
+    if given, is called on every lookup and its result is added to the key,
+    e.g. the calendar date so that an entry never outlives its day.
+    """
+    file_cache = FileCache(namespace)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            parts = (func.__qualname__, args, sorted(kwargs.items()))
+            if key_scope is not None:
+                parts += (key_scope(),)
+            key = make_key(*parts)
+            return file_cache.get_or_set(
+                key, ttl_seconds, lambda: func(*args, **kwargs), cache_if=cache_if
+            )
+        return wrapper
+    return decorator
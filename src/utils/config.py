@@ -1,10 +1,19 @@
 # utils/config.py
+import functools
 import json
 import os
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
-def load_config(config_path: str = None) -> Dict[str, Any]:
-    """Load configuration from file or return defaults"""
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only proxies so cached config can't be mutated"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+@functools.lru_cache(maxsize=8)
+def load_config(config_path: str = None) -> Mapping[str, Any]:
+    """Load configuration from file or return defaults (read once per path, returned read-only)"""
     
     # Default configuration
     default_config = {
@@ -36,4 +45,4 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
     if env_data_dir:
         default_config['data_dir'] = env_data_dir
     
-    return default_config
\ No newline at end of file
+    return _freeze(default_config)
\ No newline at end of file
@@ -1,24 +1,181 @@
 # utils/google_sheets.py - FIXED HEADERS VERSION
 import gspread
+from gspread.utils import rowcol_to_a1
 from google.oauth2.service_account import Credentials
-import pandas as pd
-from typing import Dict, Any, List
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Set, Tuple
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
 import logging
-import traceback
 import json
 import os
+from urllib.parse import quote
 from datetime import datetime
 
+# Sheets REST request bodies / responses (orjson when available, stdlib json otherwise)
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY, default=str)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, default=str).encode('utf-8')
+
 logger = logging.getLogger(__name__)
 
+# Shared stand-in for a missing source block (never mutated)
+EMPTY: Dict[str, Any] = {}
+
+# Timestamp (column A) and day formats; both derived from one datetime per export
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+_DATE_FMT = "%Y-%m-%d"
+
+# Sheets REST API (values.append / values.update) used for the row writes
+SHEETS_API_URL = "https://sheets.googleapis.com/v4/spreadsheets"
+
+# Transient Sheets/Drive errors are retried inside urllib3 (idempotent methods only,
+# so values.append is never duplicated); once retries run out the last response is
+# returned, so callers raise APIError with the Sheets error body
+SHEETS_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    raise_on_status=False
+)
+
+# Source keys are matched case-insensitively, ignoring '/' and '^' ('EUR/MAD' == 'eurmad')
+_KEY_STRIP_TABLE = str.maketrans('', '', '/^')
+
+def _normalize_key(key) -> str:
+    return str(key).lower().translate(_KEY_STRIP_TABLE)
+
+def _normalize_aliases(keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Normalized aliases, duplicates removed, original priority kept"""
+    return tuple(dict.fromkeys(_normalize_key(key) for key in keys))
+
+# Rank of source keys that are not a listed alias spelling
+_UNRANKED = float('inf')
+
+def _normalize_block(block, priority: Dict[str, int] = EMPTY) -> Dict[str, Any]:
+    """
+    One source's data re-keyed by normalized name (EMPTY for missing/non-dict blocks).
+
+    When several keys normalize to the same name ('BRENT' and 'brent'), the one
+    listed earliest in its column's aliases (priority: spelling -> rank) wins,
+    as with the original exact-spelling lookup; unlisted spellings rank last.
+    """
+    if not isinstance(block, dict) or not block:
+        return EMPTY
+    
+    normalized = {}
+    ranks = {}
+    for key, value in block.items():
+        name = _normalize_key(key)
+        rank = priority.get(key, _UNRANKED)
+        if name not in ranks or rank < ranks[name]:
+            normalized[name] = value
+            ranks[name] = rank
+    return normalized
+
+_MISSING = object()
+
+@functools.lru_cache(maxsize=None)
+def _compile_extractor(extractors: Tuple[Tuple[str, Tuple[str, ...]], ...]):
+    """
+    Generate a straight-line extraction function for an extractor table.
+
+    For every column the first present alias wins (missing -> ''), and nested
+    {'value': ...} / {'data': ...} entries are unwrapped. Aliases are matched
+    after normalization; compiled once per table.
+    """
+    sources = list(dict.fromkeys(source for source, _ in extractors))
+    
+    # Per source: alias spelling -> position in its column's alias list
+    priorities = {source: {} for source in sources}
+    for source, keys in extractors:
+        for rank, key in enumerate(keys):
+            priority = priorities[source]
+            priority[key] = min(rank, priority.get(key, rank))
+    
+    lines = ["def _fast_extract(all_data, now_ts):"]
+    for i, source in enumerate(sources):
+        lines.append(f"    b{i} = _normalize_block(all_data.get({source!r}), p{i})")
+    lines.append("    values = [now_ts]")
+    lines.append("    append = values.append")
+    for source, raw_keys in extractors:
+        keys = _normalize_aliases(raw_keys)
+        block = f"b{sources.index(source)}"
+        lines.append(f"    v = {block}.get({keys[0]!r}, _MISSING)" if keys else "    v = _MISSING")
+        for key in keys[1:]:
+            lines.append(f"    if v is _MISSING: v = {block}.get({key!r}, _MISSING)")
+        lines.append("    if v is _MISSING: v = ''")
+        lines.append("    elif type(v) is dict: v = v.get('value', v.get('data', ''))")
+        lines.append("    append(v)")
+    lines.append("    return values")
+    
+    # Priority maps are bound once here, not rebuilt as literals on every call
+    namespace = {'_normalize_block': _normalize_block, '_MISSING': _MISSING}
+    namespace.update((f"p{i}", priorities[source]) for i, source in enumerate(sources))
+    exec(compile("\n".join(lines), '<extractor>', 'exec'), namespace)
+    return namespace['_fast_extract']
+
 class UnifiedDataExporter:
     """Exporter that organizes all data in a single unified format with proper headers"""
     
+    # (all_data source, accepted keys) for each column after 'Date', in standard_columns order;
+    # keys are matched case-insensitively, ignoring '/' and '^' (see _compile_extractor)
+    _EXTRACTORS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+        ('bkam_forex', ('EUR/MAD', 'eur_mad', 'EUR_MAD', 'EUR_MAD_value')),            # EUR/MAD
+        ('bkam_forex', ('USD/MAD', 'usd_mad', 'USD_MAD', 'USD_MAD_value')),            # USD/MAD
+        ('bkam_treasury', ('BT2Y', 'bt2y', '2Y', '2y', 'BT2Y_value')),                 # BT2Y (%)
+        ('bkam_treasury', ('BT5Y', 'bt5y', '5Y', '5y', 'BT5Y_value')),                 # BT5Y (%)
+        ('bkam_treasury', ('BT10Y', 'bt10y', '10Y', '10y', 'BT10Y_value')),            # BT10Y (%)
+        ('investing_masi', ('MASI', 'masi', 'value', 'index')),                        # MASI
+        ('trading_economics', ('Phosphate DAP', 'phosphate', 'DAP', 'value', 'price')),  # Phosphate DAP (USD/T)
+        ('yahoo_markets', ('BRENT', 'brent', 'OIL_BRENT')),                            # BRENT (USD)
+        ('yahoo_markets', ('WTI', 'wti', 'OIL_WTI')),                                  # WTI (USD)
+        ('yahoo_markets', ('GOLD', 'gold', 'XAU')),                                    # GOLD (USD)
+        ('yahoo_markets', ('SILVER', 'silver', 'XAG')),                                # SILVER (USD)
+        ('yahoo_markets', ('BITCOIN', 'bitcoin', 'BTC')),                              # BITCOIN (USD)
+        ('yahoo_markets', ('EURUSD', 'eurusd', 'EUR_USD')),                            # EUR/USD
+        ('yahoo_markets', ('USDJPY', 'usdjpy', 'USD_JPY')),                            # USD/JPY
+        ('yahoo_markets', ('GBPUSD', 'gbpusd', 'GBP_USD')),                            # GBP/USD
+        ('yahoo_markets', ('SP500', 'sp500', 'S&P500', '^GSPC')),                      # S&P 500
+        ('yahoo_markets', ('DJIA', 'dow', 'DOW', '^DJI')),                             # Dow Jones
+        ('yahoo_markets', ('NASDAQ', 'nasdaq', '^IXIC', 'NAS100')),                    # NASDAQ
+        ('yahoo_markets', ('US10Y', 'us10y', '10Y', 'UST10Y')),                        # US 10Y Yield (%)
+        ('yahoo_markets', ('VIX', 'vix', '^VIX')),                                     # VIX
+    )
+    
+    # (spreadsheet_id, worksheet title) pairs whose header row was already checked
+    # in this process; shared by all exporter instances
+    _headers_verified: Set[Tuple[str, str]] = set()
+    
     def __init__(self, credentials_path: str):
         """Initialize Google Sheets exporter"""
         self.credentials_path = credentials_path
         self.client = None
         self.spreadsheet_id = '1unwXUkxs7boI1I29iumlJd3E9WcK9BngF_D4NFWDb90'
+        self.sheet_name = "Finance Bladi"
+        
+        # Reused across exports; reset on token expiry or a 401
+        self._credentials = None
+        self._session = None
+        self._spreadsheet = None
+        self._worksheets = {}
+        
+        # Extraction specialized for _EXTRACTORS (shared by all instances)
+        self._fast_extract = _compile_extractor(self._EXTRACTORS)
+        
+        # Runs extraction while authentication / sheet setup calls are in flight
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sheets-extract')
         
         # Standard columns in order
         self.standard_columns = [
@@ -34,11 +191,13 @@ class UnifiedDataExporter:
         ]
     
     def _authenticate(self):
-        """Authenticate with Google Sheets API - FIXED"""
+        """Authenticate with Google Sheets API - FIXED (no-op while the cached client is valid)"""
+        if self.client is not None and not self._credentials.expired:
+            return True
+        
         try:
             # First, validate credentials.json
             with open(self.credentials_path, 'r') as f:
-                import json
                 creds_data = json.load(f)
                 
             # Check required fields
@@ -57,7 +216,12 @@ class UnifiedDataExporter:
             credentials = Credentials.from_service_account_file(
                 self.credentials_path, scopes=scopes
             )
-            self.client = gspread.authorize(credentials)
+            self._reset_client()
+            self._credentials = credentials
+            # One pooled keep-alive session shared by gspread and the direct REST writes
+            self._session = AuthorizedSession(credentials)
+            self._session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=SHEETS_RETRY))
+            self.client = gspread.Client(auth=credentials, session=self._session)
             print("✅ Google Sheets authentication successful")
             return True
             
@@ -69,15 +233,82 @@ class UnifiedDataExporter:
             print(f"❌ Authentication failed: {e}")
             return False
     
+    def _reset_client(self):
+        """Drop the cached client, spreadsheet and worksheet handles"""
+        self.client = None
+        self._credentials = None
+        self._session = None
+        self._spreadsheet = None
+        self._worksheets = {}
+    
+    def _values_request(self, method: str, range_name: str, params: Dict[str, str], body: Dict[str, Any]):
+        """Call spreadsheets.values directly (no gspread preflight), raising APIError on failure"""
+        url = f"{SHEETS_API_URL}/{self.spreadsheet_id}/values/{quote(range_name, safe='')}"
+        if method == 'POST':
+            url += ':append'
+        response = self._session.request(
+            method, url, params=params, data=_dumps(body),
+            headers={'Content-Type': 'application/json'}
+        )
+        if not response.ok:
+            raise gspread.exceptions.APIError(response)
+        return _loads(response.content)
+    
+    def _append_row(self, values: List) -> Dict[str, Any]:
+        """Append one row after the table in a single values.append call"""
+        last_col = rowcol_to_a1(1, len(values)).rstrip('0123456789')
+        return self._values_request(
+            'POST', f"'{self.sheet_name}'!A:{last_col}",
+            {'valueInputOption': 'USER_ENTERED', 'insertDataOption': 'INSERT_ROWS'},
+            {'values': [values]}
+        )
+    
+    def _update_row(self, row_index: int, values: List) -> Dict[str, Any]:
+        """Overwrite one row in a single values.update call"""
+        range_name = f"'{self.sheet_name}'!A{row_index}:{rowcol_to_a1(row_index, len(values))}"
+        return self._values_request(
+            'PUT', range_name,
+            {'valueInputOption': 'USER_ENTERED'},
+            {'range': range_name, 'majorDimension': 'ROWS', 'values': [values]}
+        )
+    
+    def _get_worksheet(self, sheet_name: str):
+        """Get (or create) a worksheet, opening the spreadsheet only once"""
+        worksheet = self._worksheets.get(sheet_name)
+        if worksheet is not None:
+            return worksheet
+        
+        if self._spreadsheet is None:
+            self._spreadsheet = self.client.open_by_key(self.spreadsheet_id)
+            print(f"✅ Opened spreadsheet: {self._spreadsheet.title}")
+        
+        try:
+            worksheet = self._spreadsheet.worksheet(sheet_name)
+            print(f"✅ Using existing worksheet: '{sheet_name}'")
+        except gspread.exceptions.WorksheetNotFound:
+            print(f"📝 Creating new worksheet: '{sheet_name}'")
+            worksheet = self._spreadsheet.add_worksheet(
+                title=sheet_name, 
+                rows=1000, 
+                cols=len(self.standard_columns)
+            )
+        
+        self._worksheets[sheet_name] = worksheet
+        return worksheet
+    
     def _ensure_headers_exist(self, worksheet) -> bool:
-        """Make sure headers exist in the first row"""
+        """Make sure headers exist in the first row (checked once per worksheet per process)"""
+        key = (self.spreadsheet_id, worksheet.title)
+        if key in self._headers_verified:
+            return True
+        
         try:
-            # Get first row
-            first_row = worksheet.row_values(1)
+            # Only A1 is needed to tell whether the header row is there
+            first_cell = worksheet.acell('A1').value or ''
             
-            # If first row is empty or doesn't match our standard headers, recreate them
-            if not first_row or first_row[0] != 'Date':
-                print("📋 Creating/refreshing headers...")
+            # If A1 is empty or doesn't match our standard headers, recreate them
+            if first_cell != 'Date':
+                logger.info("📋 Creating/refreshing headers...")
                 
                 # Clear the entire sheet
                 worksheet.clear()
@@ -85,220 +316,118 @@ class UnifiedDataExporter:
                 # Add headers as first row
                 worksheet.append_row(self.standard_columns)
                 
-                print(f"✅ Created headers: {self.standard_columns}")
-                return True
+                logger.debug("✅ Created headers: %s", self.standard_columns)
             else:
-                print(f"✅ Headers already exist: {first_row[:5]}...")
-                return True
+                logger.debug("✅ Headers already exist")
+            
+            self._headers_verified.add(key)
+            return True
                 
+        except gspread.exceptions.APIError:
+            # Let export_unified_data decide (re-authenticate on 401)
+            raise
         except Exception as e:
-            print(f"❌ Error ensuring headers: {e}")
+            logger.error("❌ Error ensuring headers: %s", e)
             return False
     
-    def _extract_data_values(self, all_data: Dict[str, Any]) -> List:
-        """Extract values from all_data into the standard column order"""
-        today = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        values = [today]  # Start with date
-        
-        # Helper function to safely extract values
-        def get_value(data_dict, possible_keys, default=''):
-            if not isinstance(data_dict, dict):
-                return default
+    def _extract_data_values(self, all_data: Dict[str, Any], now: datetime) -> List:
+        """Extract values from all_data into the standard column order, stamped with now"""
+        return self._fast_extract(all_data, now.strftime(_TS_FMT))
+    
+    def export_unified_data(self, all_data: Dict[str, Any]) -> bool:
+        """Export all data to a single unified sheet with proper headers"""
+        # One clock read: row timestamp and "today" can't straddle midnight
+        now = datetime.now()
+        # Pure CPU over all_data (read-only), independent of every Sheets call
+        values_future = self._executor.submit(self._extract_data_values, all_data, now)
+        try:
+            logger.debug("📤 Exporting data to Google Sheets")
             
-            for key in possible_keys:
-                if key in data_dict:
-                    val = data_dict[key]
-                    # Handle nested values
-                    if isinstance(val, dict):
-                        return val.get('value', val.get('data', default))
-                    return val
-            return default
-        
-        # Extract each value in the correct order
-        # 1. EUR/MAD
-        values.append(get_value(all_data.get('bkam_forex', {}), 
-                              ['EUR/MAD', 'eur_mad', 'EUR_MAD', 'EUR_MAD_value']))
-        
-        # 2. USD/MAD
-        values.append(get_value(all_data.get('bkam_forex', {}), 
-                              ['USD/MAD', 'usd_mad', 'USD_MAD', 'USD_MAD_value']))
-        
-        # 3. BT2Y (%)
-        values.append(get_value(all_data.get('bkam_treasury', {}), 
-                              ['BT2Y', 'bt2y', '2Y', '2y', 'BT2Y_value']))
-        
-        # 4. BT5Y (%)
-        values.append(get_value(all_data.get('bkam_treasury', {}), 
-                              ['BT5Y', 'bt5y', '5Y', '5y', 'BT5Y_value']))
-        
-        # 5. BT10Y (%)
-        values.append(get_value(all_data.get('bkam_treasury', {}), 
-                              ['BT10Y', 'bt10y', '10Y', '10y', 'BT10Y_value']))
-        
-        # 6. MASI
-        values.append(get_value(all_data.get('investing_masi', {}), 
-                              ['MASI', 'masi', 'value', 'index']))
-        
-        # 7. Phosphate DAP (USD/T)
-        values.append(get_value(all_data.get('trading_economics', {}), 
-                              ['Phosphate DAP', 'phosphate', 'DAP', 'value', 'price']))
-        
-        # Yahoo Finance Data (8-20)
-        yahoo_data = all_data.get('yahoo_markets', {})
-        
-        # 8. BRENT (USD)
-        values.append(get_value(yahoo_data, ['BRENT', 'brent', 'OIL_BRENT']))
-        
-        # 9. WTI (USD)
-        values.append(get_value(yahoo_data, ['WTI', 'wti', 'OIL_WTI']))
-        
-        # 10. GOLD (USD)
-        values.append(get_value(yahoo_data, ['GOLD', 'gold', 'XAU']))
-        
-        # 11. SILVER (USD)
-        values.append(get_value(yahoo_data, ['SILVER', 'silver', 'XAG']))
+            try:
+                return self._write_today(values_future, now)
+            except gspread.exceptions.APIError as e:
+                if getattr(e.response, 'status_code', None) != 401:
+                    raise
+                # Cached token rejected: re-authenticate once and retry
+                logger.warning("🔑 Access token rejected (401), re-authenticating...")
+                self._reset_client()
+                return self._write_today(values_future, now)
+            
+        except Exception as e:
+            logger.error("❌ Google Sheets export failed: %s", e)
+            logger.debug("Google Sheets export traceback", exc_info=True)
+            return False
+    
+    def _write_today(self, values_future: Future, now: datetime) -> bool:
+        """Write today's row, updating it in place if it already exists"""
+        log = logger.debug
         
-        # 12. BITCOIN (USD)
-        values.append(get_value(yahoo_data, ['BITCOIN', 'bitcoin', 'BTC']))
+        # Authenticate
+        if not self._authenticate():
+            logger.error("❌ Authentication failed")
+            return False
         
-        # 13. EUR/USD
-        values.append(get_value(yahoo_data, ['EURUSD', 'eurusd', 'EUR_USD']))
+        # Get or create worksheet ("Finance Bladi")
+        try:
+            worksheet = self._get_worksheet(self.sheet_name)
+        except gspread.exceptions.APIError:
+            raise
+        except Exception as e:
+            logger.error("❌ Error opening spreadsheet: %s", e)
+            return False
         
-        # 14. USD/JPY
-        values.append(get_value(yahoo_data, ['USDJPY', 'usdjpy', 'USD_JPY']))
+        # ENSURE HEADERS EXIST
+        if not self._ensure_headers_exist(worksheet):
+            logger.error("❌ Failed to ensure headers exist")
+            return False
         
-        # 15. GBP/USD
-        values.append(get_value(yahoo_data, ['GBPUSD', 'gbpusd', 'GBP_USD']))
+        # Extract today's data
+        today_values = values_future.result()
         
-        # 16. S&P 500
-        values.append(get_value(yahoo_data, ['SP500', 'sp500', 'S&P500', '^GSPC']))
+        # Get the date column only (column A), not the whole sheet
+        date_col = worksheet.col_values(1)
         
-        # 17. Dow Jones
-        values.append(get_value(yahoo_data, ['DJIA', 'dow', 'DOW', '^DJI']))
+        # Check if we have only headers (no data yet)
+        if len(date_col) <= 1:
+            # First data entry - add to row 2
+            log("📊 Adding first data row...")
+            self._append_row(today_values)
+            logger.info("✅ Added first data row with %d values", len(today_values))
+            return True
         
-        # 18. NASDAQ
-        values.append(get_value(yahoo_data, ['NASDAQ', 'nasdaq', '^IXIC', 'NAS100']))
+        # Check if today's date already exists
+        today_date = now.strftime(_DATE_FMT)
         
-        # 19. US 10Y Yield (%)
-        values.append(get_value(yahoo_data, ['US10Y', 'us10y', '10Y', 'UST10Y']))
+        # Map YYYY-MM-DD -> row index (first occurrence wins), skipping the header row
+        date_to_row = {}
+        for i, cell in enumerate(date_col[1:], start=2):
+            if cell.strip():
+                date_to_row.setdefault(cell.split()[0], i)
         
-        # 20. VIX
-        values.append(get_value(yahoo_data, ['VIX', 'vix', '^VIX']))
+        existing_row_index = date_to_row.get(today_date)
         
-        return values
-    
-    def export_unified_data(self, all_data: Dict[str, Any]) -> bool:
-        """Export all data to a single unified sheet with proper headers"""
-        try:
-            print("\n" + "="*60)
-            print("📤 EXPORTING DATA TO GOOGLE SHEETS")
-            print("="*60)
-            
-            # Authenticate
-            if not self._authenticate():
-                print("❌ Authentication failed")
-                return False
+        if existing_row_index:
+            # Update existing row
+            log("📝 Updating existing row for %s (row %d)...", today_date, existing_row_index)
             
-            # Open spreadsheet
-            try:
-                spreadsheet = self.client.open_by_key(self.spreadsheet_id)
-                print(f"✅ Opened spreadsheet: {spreadsheet.title}")
-            except Exception as e:
-                print(f"❌ Error opening spreadsheet: {e}")
-                return False
+            # Update the whole row in a single API call
+            self._update_row(existing_row_index, today_values)
             
-            # Use "Finance Bladi" as sheet name
-            sheet_name = "Finance Bladi"
-            
-            # Get or create worksheet
-            try:
-                worksheet = spreadsheet.worksheet(sheet_name)
-                print(f"✅ Using existing worksheet: '{sheet_name}'")
-            except:
-                print(f"📝 Creating new worksheet: '{sheet_name}'")
-                worksheet = spreadsheet.add_worksheet(
-                    title=sheet_name, 
-                    rows=1000, 
-                    cols=len(self.standard_columns)
-                )
-            
-            # ENSURE HEADERS EXIST
-            if not self._ensure_headers_exist(worksheet):
-                print("❌ Failed to ensure headers exist")
-                return False
-            
-            # Extract today's data
-            today_values = self._extract_data_values(all_data)
-            
-            # Get all existing rows
-            all_rows = worksheet.get_all_values()
-            
-            # Check if we have only headers (no data yet)
-            if len(all_rows) <= 1:
-                # First data entry - add to row 2
-                print("📊 Adding first data row...")
-                worksheet.append_row(today_values)
-                print(f"✅ Added first data row with {len(today_values)} values")
-                return True
-            
-            # Check if today's date already exists
-            today_date = datetime.now().strftime("%Y-%m-%d")
-            existing_dates = []
-            
-            # Skip header row (row 1)
-            for i, row in enumerate(all_rows[1:], start=2):
-                if row and row[0]:  # Check if row has data and date exists
-                    # Extract date part from timestamp
-                    try:
-                        row_date = row[0].split()[0]  # Get YYYY-MM-DD part
-                        existing_dates.append((i, row_date))
-                    except:
-                        continue
-            
-            # Check if today exists
-            today_exists = False
-            existing_row_index = None
-            
-            for row_index, row_date in existing_dates:
-                if row_date == today_date:
-                    today_exists = True
-                    existing_row_index = row_index
-                    break
-            
-            if today_exists and existing_row_index:
-                # Update existing row
-                print(f"📝 Updating existing row for {today_date} (row {existing_row_index})...")
-                
-                # Update each cell
-                for col_index, value in enumerate(today_values, start=1):
-                    worksheet.update_cell(existing_row_index, col_index, value)
-                
-                print(f"✅ Updated row {existing_row_index}")
-            else:
-                # Add new row
-                print(f"📝 Adding new row for {today_date}...")
-                worksheet.append_row(today_values)
-                print(f"✅ Added new row (row {len(all_rows) + 1})")
-            
-            print("\n" + "="*60)
-            print("✅ EXPORT COMPLETED SUCCESSFULLY")
-            print("="*60)
-            
-            # Show preview
-            print(f"\n📋 Data Preview:")
-            print(f"   Date: {today_values[0]}")
-            print(f"   EUR/MAD: {today_values[1]}")
-            print(f"   USD/MAD: {today_values[2]}")
-            print(f"   MASI: {today_values[6]}")
-            print(f"   ... and {len(today_values)-7} more values")
-            
-            return True
-            
-        except Exception as e:
-            print(f"\n❌ Export failed: {str(e)}")
-            logger.error(f"Google Sheets export failed: {str(e)}")
-            logger.debug(traceback.format_exc())
-            return False
+            log("✅ Updated row %d", existing_row_index)
+        else:
+            # Add new row
+            log("📝 Adding new row for %s...", today_date)
+            self._append_row(today_values)
+            log("✅ Added new row (row %d)", len(date_col) + 1)
+        
+        # Show preview (only built when INFO is enabled)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "✅ Export completed: Date=%s EUR/MAD=%s USD/MAD=%s MASI=%s (+%d more values)",
+                today_values[0], today_values[1], today_values[2], today_values[6], len(today_values) - 7
+            )
+        
+        return True
 
 def test_with_real_data():
     """Test with real data structure from your modules"""
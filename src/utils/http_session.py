@@ -0,0 +1,181 @@
+import logging
+import threading
+import time
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# (connect, read) timeouts in seconds, slightly above healthy p95 response times
+DEFAULT_TIMEOUT = (3, 8)
+
+# Retries happen inside urllib3 with exponential backoff; Retry-After is honoured
+RETRY_POLICY = Retry(
+    total=2,
+    backoff_factor=0.5,
+    status_forcelist=[500, 502, 503, 504, 429],
+    allowed_methods=frozenset(['GET']),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Responses that mean "this host is refusing us" (WAF block, throttling)
+BLOCKED_STATUSES = frozenset([403, 429])
+
+class CircuitOpen(RequestException):
+    """Raised instead of sending a request while the target host's circuit is open."""
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    After failure_threshold consecutive failures a host is skipped for
+    reset_seconds; the first request after the cool-down is let through
+    as a probe and a single further failure re-opens the circuit. Other
+    requests to the host are refused until the probe's outcome is recorded
+    (or, if it never is, for another reset_seconds).
+    """
+
+    def __init__(self, failure_threshold=3, reset_seconds=60):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = {}
+        self._open_until = {}
+        self._probe_until = {}
+        self._lock = threading.Lock()
+
+    def allow(self, host):
+        with self._lock:
+            now = time.monotonic()
+            probe_until = self._probe_until.get(host)
+            if probe_until is not None and now < probe_until:
+                return False
+            open_until = self._open_until.get(host)
+            if open_until is None and probe_until is None:
+                return True
+            if open_until is not None and now < open_until:
+                return False
+            # Half-open: allow one probe, trip again on its failure
+            self._open_until.pop(host, None)
+            self._probe_until[host] = now + self.reset_seconds
+            self._failures[host] = self.failure_threshold - 1
+            return True
+
+    def record_success(self, host):
+        with self._lock:
+            self._probe_until.pop(host, None)
+            self._failures.pop(host, None)
+
+    def record_failure(self, host):
+        with self._lock:
+            self._probe_until.pop(host, None)
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if failures >= self.failure_threshold:
+                self._open_until[host] = time.monotonic() + self.reset_seconds
+                logger.warning(f"⚠️ Circuit open for {host} after {failures} failures ({self.reset_seconds}s cool-down)")
+
+BREAKER = CircuitBreaker()
+
+class _BreakerSession(requests.Session):
+    """requests.Session that consults a CircuitBreaker before every request."""
+
+    def __init__(self, breaker):
+        super().__init__()
+        self.breaker = breaker
+
+    def request(self, method, url, *args, **kwargs):
+        host = urlsplit(url).hostname
+        if not self.breaker.allow(host):
+            raise CircuitOpen(f"Circuit open for {host}, request skipped")
+
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except RequestException:
+            self.breaker.record_failure(host)
+            raise
+
+        if response.status_code >= 500 or response.status_code in BLOCKED_STATUSES:
+            self.breaker.record_failure(host)
+        else:
+            self.breaker.record_success(host)
+        return response
+
+class _BreakerClient(httpx.Client):
+    """httpx.Client that consults a CircuitBreaker before every request."""
+
+    def __init__(self, breaker, **kwargs):
+        super().__init__(**kwargs)
+        self.breaker = breaker
+
+    def send(self, request, **kwargs):
+        host = request.url.host
+        if not self.breaker.allow(host):
+            raise CircuitOpen(f"Circuit open for {host}, request skipped")
+
+        try:
+            response = super().send(request, **kwargs)
+        except httpx.HTTPError:
+            self.breaker.record_failure(host)
+            raise
+
+        if response.status_code >= 500 or response.status_code in BLOCKED_STATUSES:
+            self.breaker.record_failure(host)
+        else:
+            self.breaker.record_success(host)
+        return response
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+_HTTP_CLIENT = None
+
+def get_session():
+    """
+    Returns a process-wide requests.Session shared by the collectors.
+
+    Reusing one session keeps connections alive between calls to the same
+    host, so only the first request pays the TCP + TLS handshake. Requests
+    to a host that keeps failing raise CircuitOpen without hitting the network.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = _BreakerSession(BREAKER)
+            session.headers.update(DEFAULT_HEADERS)
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=RETRY_POLICY)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _SESSION = session
+    return _SESSION
+
+def get_http_client():
+    """
+    Returns a process-wide HTTP/2 httpx.Client for hosts hit many times per run.
+
+    Concurrent requests to the same host (e.g. Investing.com fallbacks from
+    the thread pool) are multiplexed as streams over one TLS connection.
+    Shares the circuit breaker with get_session().
+    """
+    global _HTTP_CLIENT
+    with _SESSION_LOCK:
+        if _HTTP_CLIENT is None:
+            connect_timeout, read_timeout = DEFAULT_TIMEOUT
+            _HTTP_CLIENT = _BreakerClient(
+                BREAKER,
+                http2=True,
+                headers=DEFAULT_HEADERS,
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+                follow_redirects=True
+            )
+    return _HTTP_CLIENT
@@ -1,40 +1,112 @@
 import cloudscraper
+import functools
 import logging
-import time
+import os
+import sys
+import threading
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+
+try:
+    from requests_cache import CacheMixin
+except ImportError:
+    CacheMixin = None
+
+try:
+    from src.utils.cache import CACHE_DIR
+except ImportError:
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+    from src.utils.cache import CACHE_DIR
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeouts in seconds
+REQUEST_TIMEOUT = (10, 20)
+
+@functools.lru_cache(maxsize=8)
+def _retry_policy(retries, backoff):
+    """
+    Transparent retries for transient errors only: jittered exponential
+    backoff, Retry-After honoured on 429/503, permanent 4xx returned at once.
+    """
+    return Retry(
+        total=retries,
+        backoff_factor=backoff,
+        backoff_jitter=0.3,
+        status_forcelist=(408, 429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'POST']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+
+RETRY_POLICY = _retry_policy(3, 0.5)
+
+SCRAPER_BROWSER = {
+    'browser': 'chrome',
+    'platform': 'windows',
+    'desktop': True
+}
+
+# HTTP-level cache for scraped pages (requests-cache, if installed): responses are
+# reused for an hour, Cache-Control / ETag / Last-Modified revalidation is honoured
+# (a 304 serves the stored body) and a stale copy is returned if the site errors
+HTTP_CACHE_OPTIONS = {
+    'cache_name': os.path.join(CACHE_DIR, 'scraper_http'),
+    'backend': 'sqlite',
+    'expire_after': 3600,
+    'cache_control': True,
+    'stale_if_error': True
+}
+
+if CacheMixin is not None:
+    class CachedScraper(CacheMixin, cloudscraper.CloudScraper):
+        """CloudScraper whose GET responses go through the requests-cache store."""
+else:
+    CachedScraper = None
+
+# One scraper per thread: sessions are not thread-safe, but each thread
+# keeps its connections (and Cloudflare cookies) alive across fetch_url calls
+_local = threading.local()
+
 def get_scraper():
     """
-    Creates a CloudScraper session configured to mimic a real Chrome browser on Windows.
+    Returns this thread's CloudScraper session configured to mimic a real Chrome
+    browser on Windows, creating it on first use.
     """
+    scraper = getattr(_local, 'scraper', None)
+    if scraper is not None:
+        return scraper
+
     try:
-        return cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'desktop': True
-            }
-        )
+        if CachedScraper is not None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            scraper = CachedScraper.create_scraper(browser=SCRAPER_BROWSER, **HTTP_CACHE_OPTIONS)
+        else:
+            scraper = cloudscraper.create_scraper(browser=SCRAPER_BROWSER)
+        # Keep cloudscraper's own TLS adapters, only attach the retry policy
+        for prefix in ('https://', 'http://'):
+            scraper.get_adapter(prefix).max_retries = RETRY_POLICY
+        _local.scraper = scraper
+        return scraper
     except Exception as e:
         logger.error(f"Failed to create scraper: {e}")
         return None
 
-def fetch_url(url, retries=3, delay=2):
+def fetch_url(url, retries=3, delay=0.5):
     """
     Smart fetcher that handles WAF blocking (403 errors).
     
     Logic:
     1. Tries a standard GET request mimicking Chrome.
-    2. If blocked (403), tries a POST request (common WAF bypass).
-    3. Retries on connection failures.
+    2. If blocked (403), tries a POST request once (common WAF bypass).
+    3. Connection failures and transient statuses (408/429/5xx) are retried
+       inside urllib3 with jittered exponential backoff; other 4xx fail at once.
     
     Args:
         url (str): Target URL.
-        retries (int): Number of attempts.
-        delay (int): Seconds to wait between retries.
+        retries (int): Maximum retries on transient failures.
+        delay (float): Backoff factor in seconds (delay, 2*delay, 4*delay, ...).
         
     Returns:
         response object or None
@@ -43,33 +115,31 @@ def fetch_url(url, retries=3, delay=2):
     if not scraper:
         return None
 
-    for attempt in range(1, retries + 1):
-        try:
-            logger.info(f"🌐 Fetching {url} (Attempt {attempt}/{retries})...")
-            
-            # 1. Try Standard GET
-            response = scraper.get(url, timeout=30)
-            
-            # 2. WAF Bypass Strategy: If GET is blocked (403), try POST
-            # Many firewalls block automated GETs but are lenient with POSTs
-            if response.status_code == 403:
-                logger.warning("⚠️ GET 403 Forbidden. Switching to POST method to bypass WAF...")
-                response = scraper.post(url, timeout=30)
-            
-            # 3. Check Success
-            if response.status_code == 200:
-                return response
-            else:
-                logger.warning(f"❌ Request failed with status code: {response.status_code}")
-                
-        except RequestException as e:
-            logger.error(f"❌ Network Error: {e}")
-        except Exception as e:
-            logger.error(f"❌ Unexpected Error: {e}")
+    policy = _retry_policy(retries, delay)
+    for prefix in ('https://', 'http://'):
+        scraper.get_adapter(prefix).max_retries = policy
+
+    try:
+        logger.info(f"🌐 Fetching {url}...")
+        
+        # 1. Try Standard GET
+        response = scraper.get(url, timeout=REQUEST_TIMEOUT)
+        
+        # 2. WAF Bypass Strategy: If GET is blocked (403), try POST
+        # Many firewalls block automated GETs but are lenient with POSTs
+        if response.status_code == 403:
+            logger.warning("⚠️ GET 403 Forbidden. Switching to POST method to bypass WAF...")
+            response = scraper.post(url, timeout=REQUEST_TIMEOUT)
         
-        # Wait before retrying (exponential backoff optional, here simple delay)
-        if attempt < retries:
-            time.sleep(delay)
+        # 3. Check Success
+        if response.status_code == 200:
+            return response
+        logger.warning(f"❌ Request failed with status code: {response.status_code}")
+            
+    except RequestException as e:
+        logger.error(f"❌ Network Error: {e}")
+    except Exception as e:
+        logger.error(f"❌ Unexpected Error: {e}")
 
-    logger.error(f"❌ Failed to fetch {url} after {retries} attempts.")
-    return None
\ No newline at end of file
+    logger.error(f"❌ Failed to fetch {url} (up to {retries} retries).")
+    return None
@@ -1,4 +1,5 @@
 # test_imports.py - FIXED VERSION
+import importlib.util
 import os
 import sys
 
@@ -31,37 +32,32 @@ print("\n" + "="*60)
 print("TESTING MODULE IMPORTS")
 print("="*60)
 
+# One directory scan instead of a stat per module
+available = {
+    entry.name[:-3]: entry.path
+    for entry in os.scandir(src_modules_path)
+    if entry.is_file() and entry.name.endswith('.py')
+}
+
 for module_name in modules_to_test:
-    module_path = os.path.join(src_modules_path, f'{module_name}.py')
+    module_path = available.get(module_name)
     
-    if os.path.exists(module_path):
+    if module_path:
         print(f"\n📁 {module_name}.py exists at: {module_path}")
         
         try:
-            # Try importing
-            module = __import__(module_name)
+            # Load straight from the file (no sys.path search)
+            spec = importlib.util.spec_from_file_location(module_name, module_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
             print(f"✅ SUCCESS: Imported {module_name}")
             
             # Check functions
-            if hasattr(module, 'collect_data'):
-                print(f"   Has 'collect_data()' function: ✅")
-            if hasattr(module, 'main'):
-                print(f"   Has 'main()' function: ✅")
-            if hasattr(module, 'run'):
-                print(f"   Has 'run()' function: ✅")
+            for func_name in ('collect_data', 'main', 'run'):
+                if getattr(module, func_name, None) is not None:
+                    print(f"   Has '{func_name}()' function: ✅")
                 
-        except ImportError as e:
+        except Exception as e:
             print(f"❌ FAILED: Import error: {e}")
-            print(f"   Trying alternative import method...")
-            
-            # Try with different import method
-            try:
-                import importlib.util
-                spec = importlib.util.spec_from_file_location(module_name, module_path)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                print(f"✅ SUCCESS: Loaded via importlib")
-            except Exception as e2:
-                print(f"❌ Alternative method also failed: {e2}")
     else:
-        print(f"\n❌ {module_name}.py NOT FOUND at: {module_path}")
\ No newline at end of file
+        print(f"\n❌ {module_name}.py NOT FOUND in: {src_modules_path}")
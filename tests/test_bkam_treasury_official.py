@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.modules import bkam_treasury_official
+from src.modules.bkam_treasury_official import interpolate_linear
+
+# Undecorated collector: no on-disk cache between tests
+collect = bkam_treasury_official.get_bkam_treasury_official.__wrapped__
+
+
+def page(date_header, rows):
+    cells = "".join(f"<tr><td>{d}</td><td>{r}</td></tr>" for d, r in rows)
+    return (
+        f"<html><body><table><thead><tr><th>{date_header}</th><th>Taux moyen pondéré</th></tr></thead>"
+        f"<tbody>{cells}</tbody></table></body></html>"
+    )
+
+
+def serve(monkeypatch, html, encoding='utf-8'):
+    response = SimpleNamespace(content=html.encode(encoding), encoding=encoding)
+    monkeypatch.setattr(bkam_treasury_official, 'fetch_url', lambda url: response)
+
+
+def expected(points):
+    """Results for (days ahead, rate) points, as computed by the collector."""
+    data = [{'days': days - 1, 'rate': rate, 'date': None} for days, rate in points]
+    return {key: interpolate_linear(years, data, days) for key, years, days in bkam_treasury_official._STANDARD}
+
+
+def test_mixed_date_layouts_are_all_kept(monkeypatch):
+    today = datetime.now()
+    due = [today + timedelta(days=n) for n in (365, 1000, 3000, 4000)]
+    serve(monkeypatch, page("Date d'echeance", [
+        (due[0].strftime('%d/%m/%Y'), '2,000 %'),
+        (due[1].strftime('%d/%m/%Y 00:00'), '2,500 %'),
+        (due[2].strftime('%d/%m/%Y'), '3,000 %'),
+        (due[3].strftime('%Y-%m-%d'), '5,000 %'),
+    ]))
+
+    assert collect() == pytest.approx(expected([(365, 2.0), (1000, 2.5), (3000, 3.0), (4000, 5.0)]))
+
+
+def test_day_first_dates(monkeypatch):
+    # 03/04 must be read as 3 April, not March 4
+    due = datetime(datetime.now().year + 3, 4, 3)
+    serve(monkeypatch, page("Date d'echeance", [(due.strftime('%d/%m/%Y'), '2,500 %')]))
+
+    assert collect() == {'bt2y': 2.5, 'bt5y': 2.5, 'bt10y': 2.5}
+
+
+def test_header_decoded_with_http_charset(monkeypatch):
+    # UTF-8 page without <meta charset>: 'échéance' must still match
+    due = datetime.now() + timedelta(days=1000)
+    serve(monkeypatch, page("Date d'échéance", [(due.strftime('%d/%m/%Y'), '2,500 %')]))
+
+    assert collect() == {'bt2y': 2.5, 'bt5y': 2.5, 'bt10y': 2.5}
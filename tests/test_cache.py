@@ -0,0 +1,68 @@
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from src.modules.yahoo_markets import _has_any_price
+from src.utils import cache as cache_module
+from src.utils.cache import FileCache, cached
+
+
+def test_get_returns_fresh_values_only(tmp_path):
+    cache = FileCache('ns', cache_dir=str(tmp_path))
+    cache.set('k', {'a': 1})
+
+    assert cache.get('k', ttl_seconds=60) == {'a': 1}
+    assert cache.get('k', ttl_seconds=0, default='stale') == 'stale'
+    assert cache.get('missing', ttl_seconds=60) is None
+
+
+def test_concurrent_sets_of_one_key(tmp_path):
+    cache = FileCache('ns', cache_dir=str(tmp_path))
+    payload = {'values': list(range(2000))}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: cache.set('k', dict(payload, writer=i)), range(64)))
+
+    entry = cache.get('k', ttl_seconds=60)
+    assert entry['values'] == payload['values']
+    assert os.listdir(cache.directory) == ['k.json']
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path):
+    cache = FileCache('ns', cache_dir=str(tmp_path))
+    cache.set('k', [])
+    looped = []
+    looped.append(looped)
+    cache.set('k', looped)  # ValueError: circular reference
+
+    assert os.listdir(cache.directory) == ['k.json']
+    assert cache.get('k', ttl_seconds=60) == []
+
+
+def test_failed_yahoo_runs_are_not_cached(tmp_path):
+    cache = FileCache('yahoo', cache_dir=str(tmp_path))
+    failed = {'BRENT': None, 'WTI': None, 'YAHOO_SOURCE': 'test'}
+    partial = {'BRENT': 60.4, 'WTI': None, 'YAHOO_SOURCE': 'test'}
+
+    cache.get_or_set('run', 60, lambda: failed, cache_if=_has_any_price)
+    assert cache.get('run', ttl_seconds=60) is None
+
+    cache.get_or_set('run', 60, lambda: partial, cache_if=_has_any_price)
+    assert cache.get('run', ttl_seconds=60) == partial
+
+
+def test_key_scope_separates_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, 'FileCache', functools.partial(FileCache, cache_dir=str(tmp_path)))
+    calls = []
+    day = ['2026-01-01']
+
+    @cached('scoped', ttl_seconds=86400, key_scope=lambda: day[0])
+    def collect():
+        calls.append(day[0])
+        return day[0]
+
+    assert collect() == '2026-01-01'
+    assert collect() == '2026-01-01'
+    day[0] = '2026-01-02'
+    assert collect() == '2026-01-02'
+    assert calls == ['2026-01-01', '2026-01-02']
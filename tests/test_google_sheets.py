@@ -0,0 +1,78 @@
+import random
+from datetime import datetime
+
+import pytest
+
+from src.utils.google_sheets import UnifiedDataExporter
+
+NOW = datetime(2026, 1, 2, 3, 4, 5)
+
+
+def legacy_get_value(data_dict, possible_keys, default=''):
+    """get_value as it was before the extractor table (exact-spelling lookup)."""
+    if not isinstance(data_dict, dict):
+        return default
+
+    for key in possible_keys:
+        if key in data_dict:
+            val = data_dict[key]
+            if isinstance(val, dict):
+                return val.get('value', val.get('data', default))
+            return val
+    return default
+
+
+def legacy_extract(all_data):
+    return [
+        legacy_get_value(all_data.get(source, {}), keys)
+        for source, keys in UnifiedDataExporter._EXTRACTORS
+    ]
+
+
+@pytest.fixture(scope='module')
+def exporter():
+    return UnifiedDataExporter('credentials.json')
+
+
+def extract(exporter, all_data):
+    values = exporter._extract_data_values(all_data, NOW)
+    assert values[0] == '2026-01-02 03:04:05'
+    return values[1:]
+
+
+@pytest.mark.parametrize('all_data', [
+    {},
+    {'bkam_forex': None, 'yahoo_markets': 'n/a'},
+    {'bkam_forex': {'eur_mad': {'value': 10.7}, 'EUR_MAD': 11}},
+    {'bkam_forex': {'EUR_MAD': 11, 'eur_mad': {'value': 10.7}}},
+    {'yahoo_markets': {'brent': 61.0, 'BRENT': 60.4}},
+    {'yahoo_markets': {'BRENT': 60.4, 'brent': 61.0, 'OIL_BRENT': 59.0}},
+    {'bkam_treasury': {'10y': 3.1, 'bt10y': {'data': 2.9}, 'BT10Y': 3.0}},
+    {'investing_masi': {'value': '19,445.46', 'index': 1}},
+    {'yahoo_markets': {'^GSPC': 6920.9, 'S&P500': 6921.0, 'DJIA': {'value': None}}},
+])
+def test_matches_legacy_lookup(exporter, all_data):
+    assert extract(exporter, all_data) == legacy_extract(all_data)
+
+
+def test_matches_legacy_lookup_randomized(exporter):
+    rng = random.Random(1234)
+    spellings = {}
+    for source, keys in UnifiedDataExporter._EXTRACTORS:
+        spellings.setdefault(source, []).extend(keys)
+
+    for _ in range(500):
+        all_data = {}
+        for source, keys in spellings.items():
+            chosen = rng.sample(keys, rng.randint(0, len(keys)))
+            all_data[source] = {
+                key: rng.choice([i, {'value': i}, {'data': i}, None])
+                for i, key in enumerate(chosen)
+            }
+        assert extract(exporter, all_data) == legacy_extract(all_data)
+
+
+def test_other_spellings_are_matched(exporter):
+    values = extract(exporter, {'bkam_forex': {'Eur/Mad': 10.7}, 'yahoo_markets': {'^vix': 15.4}})
+    assert values[0] == 10.7
+    assert values[-1] == 15.4
@@ -0,0 +1,78 @@
+import pytest
+
+from src.utils import http_session
+from src.utils.http_session import CircuitBreaker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(http_session.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def trip(breaker, host='h'):
+    for _ in range(breaker.failure_threshold):
+        assert breaker.allow(host)
+        breaker.record_failure(host)
+
+
+def test_closed_circuit_allows_everything(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=60)
+    breaker.record_failure('h')
+    breaker.record_failure('h')
+    assert all(breaker.allow('h') for _ in range(8))
+
+
+def test_open_circuit_refuses_until_cool_down(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=60)
+    trip(breaker)
+    assert not breaker.allow('h')
+    assert breaker.allow('other')
+
+    clock[0] += 59
+    assert not breaker.allow('h')
+
+
+def test_only_one_probe_after_cool_down(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=60)
+    trip(breaker)
+    clock[0] += 60
+
+    assert [breaker.allow('h') for _ in range(8)] == [True] + [False] * 7
+
+
+def test_successful_probe_closes_circuit(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=60)
+    trip(breaker)
+    clock[0] += 60
+    assert breaker.allow('h')
+    breaker.record_success('h')
+
+    assert all(breaker.allow('h') for _ in range(8))
+
+
+def test_failed_probe_reopens_circuit(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=60)
+    trip(breaker)
+    clock[0] += 60
+    assert breaker.allow('h')
+    breaker.record_failure('h')
+
+    assert not breaker.allow('h')
+    clock[0] += 60
+    assert breaker.allow('h')
+    assert not breaker.allow('h')
+
+
+def test_unreported_probe_is_replaced_after_reset_seconds(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=60)
+    trip(breaker)
+    clock[0] += 60
+    assert breaker.allow('h')
+
+    clock[0] += 30
+    assert not breaker.allow('h')
+    clock[0] += 30
+    assert breaker.allow('h')
+    assert not breaker.allow('h')